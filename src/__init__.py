@@ -1,5 +1,5 @@
 """COT Reports Analysis Package"""
 
-from .main import COTDataManager, COTPlotter
+from .main import COTDataManager, COTPlotter, ColumnSchema
 
-__all__ = ['COTDataManager', 'COTPlotter']
+__all__ = ['COTDataManager', 'COTPlotter', 'ColumnSchema']
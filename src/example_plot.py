@@ -8,45 +8,53 @@ Usage:
 from main import COTDataManager, COTPlotter
 
 
-def search_contracts(contracts, search_term):
-    """Search for contracts matching a term."""
-    # Map common aliases to full names
-    aliases = {
-        'CAD': 'CANADIAN DOLLAR',
-        'EUR': 'EURO FX',
-        'GBP': 'BRITISH POUND',
-        'JPY': 'JAPANESE YEN',
-        'CHF': 'SWISS FRANC',
-        'AUD': 'AUSTRALIAN DOLLAR',
-        'NZD': 'NEW ZEALAND DOLLAR',
-        'MXN': 'MEXICAN PESO',
-        'BRL': 'BRAZILIAN REAL',
-        'CRUDE': 'CRUDE OIL',
-        'OIL': 'CRUDE OIL',
-        'WTI': 'CRUDE OIL, LIGHT SWEET',
-        'NATGAS': 'NATURAL GAS',
-        'GAS': 'NATURAL GAS',
-        'CORN': 'CORN',
-        'WHEAT': 'WHEAT',
-        'SOYBEAN': 'SOYBEAN',
-        'SPX': 'S&P 500',
-        'SP500': 'S&P 500',
-        'ES': 'E-MINI S&P 500',
-        'NQ': 'NASDAQ',
-        'NASDAQ': 'NASDAQ',
-        'BITCOIN': 'BITCOIN',
-        'BTC': 'BITCOIN',
-        'ETHER': 'ETHER',
-        'ETH': 'ETHER',
-    }
+# Map common aliases to full names
+ALIASES = {
+    'CAD': 'CANADIAN DOLLAR',
+    'EUR': 'EURO FX',
+    'GBP': 'BRITISH POUND',
+    'JPY': 'JAPANESE YEN',
+    'CHF': 'SWISS FRANC',
+    'AUD': 'AUSTRALIAN DOLLAR',
+    'NZD': 'NEW ZEALAND DOLLAR',
+    'MXN': 'MEXICAN PESO',
+    'BRL': 'BRAZILIAN REAL',
+    'CRUDE': 'CRUDE OIL',
+    'OIL': 'CRUDE OIL',
+    'WTI': 'CRUDE OIL, LIGHT SWEET',
+    'NATGAS': 'NATURAL GAS',
+    'GAS': 'NATURAL GAS',
+    'CORN': 'CORN',
+    'WHEAT': 'WHEAT',
+    'SOYBEAN': 'SOYBEAN',
+    'SPX': 'S&P 500',
+    'SP500': 'S&P 500',
+    'ES': 'E-MINI S&P 500',
+    'NQ': 'NASDAQ',
+    'NASDAQ': 'NASDAQ',
+    'BITCOIN': 'BITCOIN',
+    'BTC': 'BITCOIN',
+    'ETHER': 'ETHER',
+    'ETH': 'ETHER',
+}
+
+
+def search_contracts(contracts, search_term, contracts_upper=None):
+    """
+    Search for contracts matching a term.
+
+    Pass contracts_upper (the uppercased contract names, in the same
+    order) when searching repeatedly to avoid re-uppercasing every name.
+    """
+    if contracts_upper is None:
+        contracts_upper = [c.upper() for c in contracts]
 
     search_term = search_term.upper()
 
     # Check if it's an alias
-    if search_term in aliases:
-        search_term = aliases[search_term]
+    search_term = ALIASES.get(search_term, search_term)
 
-    matches = [c for c in contracts if search_term in c.upper()]
+    matches = [contracts[i] for i, cu in enumerate(contracts_upper) if search_term in cu]
     return matches
 
 
@@ -56,22 +64,20 @@ def plot_example():
     # Initialize data manager
     manager = COTDataManager(data_dir="data")
 
-    # Load existing data from parquet (if already fetched)
+    # Load existing data from parquet (if already fetched). Only the
+    # contract names are loaded up front; each plot reads its own rows.
     print("Loading data from parquet files...")
     try:
-        manager.load_from_parquet()
-        print(f"Loaded {len(manager.dataframes)} report types")
+        schema = manager.get_parquet_schema('legacy_fut')
+        manager.load_from_parquet('legacy_fut', columns=[schema.contract_col])
+        print("Loaded legacy futures data")
     except Exception as e:
         print(f"Error loading data: {e}")
         print("Run main.py first to fetch and save data")
         return
 
-    # Get available contracts from legacy futures report
-    if 'legacy_fut' not in manager.dataframes:
-        print("No legacy futures data available")
-        return
-
     contracts = manager.get_available_contracts('legacy_fut')
+    contracts_upper = [c.upper() for c in contracts]
     print(f"\n{len(contracts)} contracts available")
 
     # Interactive mode - let user search and choose a contract
@@ -93,7 +99,7 @@ def plot_example():
             continue
 
         # Search for matching contracts
-        matches = search_contracts(contracts, search_input)
+        matches = search_contracts(contracts, search_input, contracts_upper)
 
         if not matches:
             print(f"No contracts found matching '{search_input}'")
@@ -113,9 +119,10 @@ def plot_example():
             # Auto-plot if only one match
             print(f"\nPlotting: {matches[0]}")
             plotter.plot_trader_positions(
-                manager.dataframes['legacy_fut'],
+                manager.load_contract('legacy_fut', matches[0], columns=schema.columns()),
                 contract_name=matches[0],
-                report_type='legacy_fut'
+                report_type='legacy_fut',
+                schema=schema
             )
         else:
             # Let user choose which one to plot
@@ -126,9 +133,10 @@ def plot_example():
                 if 1 <= choice <= len(matches):
                     print(f"\nPlotting: {matches[choice-1]}")
                     plotter.plot_trader_positions(
-                        manager.dataframes['legacy_fut'],
+                        manager.load_contract('legacy_fut', matches[choice-1], columns=schema.columns()),
                         contract_name=matches[choice-1],
-                        report_type='legacy_fut'
+                        report_type='legacy_fut',
+                        schema=schema
                     )
                 else:
                     print("Invalid choice")
@@ -12,17 +12,15 @@ def list_all_contracts():
 
     print("Loading data from parquet files...")
     try:
-        manager.load_from_parquet()
-        print(f"Loaded {len(manager.dataframes)} report types\n")
+        # Only the contract name column is needed
+        schema = manager.get_parquet_schema('legacy_fut')
+        manager.load_from_parquet('legacy_fut', columns=[schema.contract_col])
+        print("Loaded legacy futures data\n")
     except Exception as e:
         print(f"Error loading data: {e}")
         print("Run 'make fetch-data' first to download COT data")
         return
 
-    if 'legacy_fut' not in manager.dataframes:
-        print("No legacy futures data available")
-        return
-
     contracts = manager.get_available_contracts('legacy_fut')
 
     print(f"Found {len(contracts)} contracts in legacy_fut report:\n")
@@ -40,8 +38,9 @@ def list_all_contracts():
                 'YEN', 'POUND', 'FRANC', 'CORN', 'WHEAT', 'SOYBEAN', 'CATTLE', 'TREASURY']
 
     print("\nSample searches:")
+    contracts_upper = [c.upper() for c in contracts]
     for keyword in keywords:
-        matches = [c for c in contracts if keyword in c.upper()]
+        matches = [contracts[i] for i, cu in enumerate(contracts_upper) if keyword in cu]
         if matches:
             print(f"  '{keyword}': {len(matches)} match(es)")
             for match in matches[:2]:
@@ -7,12 +7,185 @@ provides plotting capabilities for trader positions.
 """
 
 import os
+import re
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import ClassVar, Dict, List, Optional, Set, Tuple
 import cot_reports as cot
 
+try:
+    import polars as pl
+except ImportError:  # polars is optional
+    pl = None
+
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    """Column names detected for a COT report (None where not present)."""
+
+    date_col: Optional[str] = None
+    contract_col: Optional[str] = None
+    comm_long: Optional[str] = None
+    comm_short: Optional[str] = None
+    noncomm_long: Optional[str] = None
+    noncomm_short: Optional[str] = None
+    small_long: Optional[str] = None
+    small_short: Optional[str] = None
+
+    # Fields read by COTPlotter.plot_trader_positions
+    PLOT_COLUMNS: ClassVar[Tuple[str, ...]] = (
+        'date_col',
+        'contract_col',
+        'comm_long',
+        'comm_short',
+        'noncomm_long',
+        'noncomm_short',
+        'small_long',
+        'small_short',
+    )
+
+    # Long/short position count fields
+    POSITION_COLUMNS: ClassVar[Tuple[str, ...]] = PLOT_COLUMNS[2:]
+
+    def columns(self, fields: Tuple[str, ...] = PLOT_COLUMNS) -> List[str]:
+        """Return the detected column names for the given fields, skipping missing ones."""
+        return [getattr(self, field) for field in fields if getattr(self, field)]
+
+
+# Long/short "(All)" position columns, e.g. "Commercial Positions-Long (All)"
+# or "Traders-Noncommercial-Short (All)". Spreading columns are excluded.
+_POSITION_COL_RE = re.compile(
+    r'(?=.*\(all\))'
+    r'(?!.*spreading)'
+    r'(?=.*(?P<positions>positions)|.*trader)'
+    r'(?=.*?(?P<category>noncommercial|nonreportable|commercial))'
+    r'(?=.*?(?P<side>long|short))'
+)
+
+_POSITION_CATEGORIES = {
+    'commercial': 'comm',            # Large Commercials
+    'noncommercial': 'noncomm',      # Large Speculators
+    'nonreportable': 'small',        # Small Speculators
+}
+
+
+def detect_column_schema(columns) -> ColumnSchema:
+    """
+    Detect the date, contract and position columns of a COT report.
+
+    All columns are classified in a single pass with one precompiled
+    regex. For each trader category the "Positions" long/short pair is
+    preferred over the "Traders" pair, and the two are never mixed.
+    Results are cached by the tuple of column names, so frames and
+    files with the same layout share one detection.
+
+    Args:
+        columns: Column names of a COT dataframe
+
+    Returns:
+        ColumnSchema with the detected column names
+    """
+    return _detect_column_schema(tuple(columns))
+
+
+@lru_cache(maxsize=64)
+def _detect_column_schema(columns: Tuple[str, ...]) -> ColumnSchema:
+    """Uncached body of detect_column_schema."""
+    date_col = None
+    contract_col = None
+    # Candidates keyed by (kind, category, side), e.g. ('positions', 'comm', 'long')
+    candidates: Dict[Tuple[str, str, str], str] = {}
+
+    for col in columns:
+        col_lower = col.lower()
+        if date_col is None and 'date' in col_lower and 'yyyy' in col_lower:
+            date_col = col
+        if contract_col is None and ('market' in col_lower or 'contract' in col_lower):
+            contract_col = col
+
+        match = _POSITION_COL_RE.match(col_lower)
+        if match:
+            kind = 'positions' if match.group('positions') else 'trader'
+            key = (kind, _POSITION_CATEGORIES[match.group('category')], match.group('side'))
+            if kind == 'positions':
+                candidates[key] = col
+            else:
+                candidates.setdefault(key, col)
+
+    slots: Dict[str, Optional[str]] = {}
+    for category in ('comm', 'noncomm', 'small'):
+        kind = 'positions'
+        if not ((kind, category, 'long') in candidates and (kind, category, 'short') in candidates):
+            if ('trader', category, 'long') in candidates and ('trader', category, 'short') in candidates:
+                kind = 'trader'
+        slots[f'{category}_long'] = candidates.get((kind, category, 'long'))
+        slots[f'{category}_short'] = candidates.get((kind, category, 'short'))
+
+    return ColumnSchema(date_col=date_col, contract_col=contract_col, **slots)
+
+
+# Characters that are not alphanumeric, space, '-' or '_'
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w \-]')
+
+
+def safe_contract_name(contract: str) -> str:
+    """Clean a contract name for use as a file or partition name."""
+    safe_name = _UNSAFE_NAME_CHARS.sub('_', contract)
+    return safe_name.replace(' ', '_')[:100]  # Limit filename length
+
+
+def _merge_arrow_types(a: pa.DataType, b: pa.DataType) -> pa.DataType:
+    """Return a type both a and b can be cast to (numbers widen, other conflicts become strings)."""
+    if a.equals(b) or pa.types.is_null(b):
+        return a
+    if pa.types.is_null(a):
+        return b
+    if pa.types.is_integer(a) and pa.types.is_integer(b):
+        return pa.int64()
+    if (pa.types.is_integer(a) or pa.types.is_floating(a)) and (pa.types.is_integer(b) or pa.types.is_floating(b)):
+        return pa.float64()
+    return pa.large_string()
+
+
+def _unified_schema(schemas) -> pa.Schema:
+    """
+    Merge the Arrow schemas of frames with different column layouts.
+
+    Columns keep their first-seen order. Categorical (dictionary) columns
+    are stored as their plain value type, since each frame has its own
+    categories.
+
+    Args:
+        schemas: Arrow schemas to merge
+
+    Returns:
+        Schema with every column of every input schema
+    """
+    types: Dict[str, pa.DataType] = {}
+    for schema in schemas:
+        for field in schema:
+            field_type = field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+            types[field.name] = _merge_arrow_types(types[field.name], field_type) if field.name in types else field_type
+    return pa.schema(list(types.items()))
+
+
+def _conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast a table to schema, adding all-null columns for fields it lacks."""
+    columns = [
+        table.column(field.name).cast(field.type) if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
 
 class COTDataManager:
     """Manages COT data fetching, storage, and analysis."""
@@ -28,6 +201,16 @@ class COTDataManager:
         'traders_in_financial_futures_futopt'
     ]
 
+    # Parquet writer settings: ZSTD compresses better than the default
+    # Snappy at similar decode speed, dictionary encoding suits the
+    # repetitive contract names, and statistics enable row group pruning
+    PARQUET_WRITE_OPTIONS = {
+        'compression': 'zstd',
+        'compression_level': 3,
+        'use_dictionary': True,
+        'write_statistics': True,
+    }
+
     def __init__(self, data_dir: str = "data"):
         """
         Initialize the COT Data Manager.
@@ -38,6 +221,110 @@ class COTDataManager:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.dataframes: Dict[str, pd.DataFrame] = {}
+        self._contracts_cache: Dict[str, List[str]] = {}
+        self._schemas: Dict[str, ColumnSchema] = {}
+        # Report types loaded with a column subset; never written back
+        self._partial_reports: Set[str] = set()
+        # Parquet file mtimes of report types loaded from disk
+        self._loaded_mtimes: Dict[str, int] = {}
+
+    def _invalidate_caches(self, report_type: str):
+        """Drop cached lookups for a report type that has been (re)loaded."""
+        self._contracts_cache.pop(report_type, None)
+        self._schemas.pop(report_type, None)
+        self._loaded_mtimes.pop(report_type, None)
+
+    def _store_frame(self, report_type: str, df: pd.DataFrame, partial: bool = False) -> pd.DataFrame:
+        """
+        Store a (re)loaded report type frame and reset its cached lookups.
+
+        The contract column is converted to a categorical so equality
+        filters compare integer codes instead of strings, and the date
+        column is parsed once here rather than on every plot. Frames
+        loaded with a column subset are marked partial so they are not
+        saved over the full report.
+        """
+        self.dataframes[report_type] = df
+        self._invalidate_caches(report_type)
+        if partial:
+            self._partial_reports.add(report_type)
+        else:
+            self._partial_reports.discard(report_type)
+
+        schema = self.get_schema(report_type)
+        if schema.contract_col and not isinstance(df[schema.contract_col].dtype, pd.CategoricalDtype):
+            df[schema.contract_col] = df[schema.contract_col].astype('category')
+        if schema.date_col:
+            self._ensure_datetime(df, schema.date_col)
+        return df
+
+    @staticmethod
+    def _parse_dates(values: pd.Series) -> pd.Series:
+        """Parse a date column, with an explicit format when its name says YYYY-MM-DD."""
+        date_format = '%Y-%m-%d' if 'yyyy-mm-dd' in str(values.name).lower() else None
+        return pd.to_datetime(values, format=date_format)
+
+    @classmethod
+    def _ensure_datetime(cls, df: pd.DataFrame, date_col: str):
+        """Parse a date column in place unless it is already datetime64."""
+        if date_col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+            df[date_col] = cls._parse_dates(df[date_col])
+
+    def get_schema(self, report_type: str) -> ColumnSchema:
+        """
+        Get the detected column schema for a loaded report type.
+
+        The schema is computed once per report type and reused until the
+        report type is reloaded.
+
+        Args:
+            report_type: The COT report type
+
+        Returns:
+            ColumnSchema for the report type
+        """
+        if report_type not in self._schemas:
+            self._schemas[report_type] = detect_column_schema(self.dataframes[report_type].columns)
+        return self._schemas[report_type]
+
+    @staticmethod
+    def _normalize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Make object columns parquet-safe in place.
+
+        Columns whose first non-null value looks numeric are converted to
+        numbers when every value parses; remaining object columns (mixed
+        types) are converted to strings.
+
+        Args:
+            df: DataFrame to normalize
+
+        Returns:
+            The same DataFrame, for chaining
+        """
+        for col in df.columns:
+            if df[col].dtype != 'object':
+                continue
+
+            non_null = df[col].dropna()
+            if not non_null.empty:
+                try:
+                    float(non_null.iloc[0])
+                    looks_numeric = True
+                except (TypeError, ValueError):
+                    looks_numeric = False
+
+                if looks_numeric:
+                    try:
+                        df[col] = pd.to_numeric(df[col])
+                    except (TypeError, ValueError):
+                        pass
+
+            # If still object type, convert to string
+            if df[col].dtype == 'object':
+                df[col] = df[col].astype(str)
+
+        return df
 
     def fetch_all_data(self) -> Dict[str, pd.DataFrame]:
         """
@@ -56,15 +343,25 @@ class COTDataManager:
                 df = cot.cot_all(cot_report_type=report_type)
 
                 if df is not None and not df.empty:
-                    # Convert Report_Date_as_YYYY-MM-DD to datetime if it exists
+                    # Convert Report_Date_as_YYYY-MM-DD to datetime if it exists.
+                    # An explicit format skips per-value format inference.
                     date_cols = [col for col in df.columns if 'date' in col.lower()]
                     for date_col in date_cols:
                         try:
-                            df[date_col] = pd.to_datetime(df[date_col])
-                        except:
+                            df[date_col] = self._parse_dates(df[date_col])
+                        except (ValueError, TypeError):
                             pass
 
-                    self.dataframes[report_type] = df
+                    # Store position counts as numbers so the saved parquet is
+                    # typed and readers never have to parse them
+                    position_cols = detect_column_schema(df.columns).columns(ColumnSchema.POSITION_COLUMNS)
+                    if position_cols:
+                        df[position_cols] = df[position_cols].apply(pd.to_numeric, errors='coerce')
+
+                    # Normalize dtypes once so the frame can be written as is
+                    self._normalize_dtypes(df)
+
+                    self._store_frame(report_type, df)
                     print(f"  ✓ Fetched {len(df):,} records from {df[date_cols[0]].min()} to {df[date_cols[0]].max()}")
                 else:
                     print(f"  ✗ No data available for {report_type}")
@@ -74,6 +371,15 @@ class COTDataManager:
 
         return self.dataframes
 
+    def _check_complete(self):
+        """Raise if any loaded report type only holds a subset of its columns."""
+        partial = [rt for rt in self.dataframes if rt in self._partial_reports]
+        if partial:
+            raise ValueError(
+                f"Report types loaded with a column subset cannot be saved or consolidated: "
+                f"{', '.join(partial)}. Reload them without columns first"
+            )
+
     def consolidate_by_contract(self) -> Dict[str, pd.DataFrame]:
         """
         Consolidate data by unique contracts across different report types.
@@ -82,43 +388,47 @@ class COTDataManager:
         Returns:
             Dictionary mapping contract names to consolidated dataframes
         """
+        self._check_complete()
         print("\nConsolidating data by contract...")
 
-        consolidated = {}
+        contract_frames: Dict[str, List[pd.DataFrame]] = {}
+        merge_date_cols: Dict[str, str] = {}
 
         for report_type, df in self.dataframes.items():
             if df.empty:
                 continue
 
             # Find contract name column (varies by report type)
-            contract_col = None
-            for col in df.columns:
-                if 'market' in col.lower() or 'contract' in col.lower():
-                    contract_col = col
-                    break
+            schema = self.get_schema(report_type)
+            contract_col = schema.contract_col
+            date_col = schema.date_col
 
             if contract_col is None:
                 print(f"  ⚠ Could not find contract column in {report_type}")
                 continue
 
-            # Group by contract
-            unique_contracts = df[contract_col].unique()
-
-            for contract in unique_contracts:
-                contract_data = df[df[contract_col] == contract].copy()
+            if date_col is None:
+                print(f"  ⚠ Could not find date column in {report_type}")
+                continue
 
-                if contract in consolidated:
-                    # Merge with existing data for this contract
-                    # Try to find common columns for merging
-                    date_col = [col for col in contract_data.columns if 'date' in col.lower()][0]
+            # Group by contract in a single pass over the frame
+            for contract, contract_data in df.groupby(contract_col, sort=False, observed=True):
+                contract_frames.setdefault(contract, []).append(contract_data)
+                merge_date_cols[contract] = date_col
 
-                    # Combine dataframes, preferring newer data on conflicts
-                    consolidated[contract] = pd.concat([
-                        consolidated[contract],
-                        contract_data
-                    ]).drop_duplicates(subset=[date_col], keep='last').sort_values(date_col)
-                else:
-                    consolidated[contract] = contract_data
+        # Merge data for contracts found in several report types in one go,
+        # preferring newer data on conflicts
+        consolidated = {}
+        for contract, frames in contract_frames.items():
+            if len(frames) == 1:
+                consolidated[contract] = frames[0]
+            else:
+                date_col = merge_date_cols[contract]
+                merged = pd.concat(frames, ignore_index=True).drop_duplicates(
+                    subset=[date_col], keep='last'
+                ).sort_values(date_col)
+                # Report types may disagree on a column's dtype
+                consolidated[contract] = self._normalize_dtypes(merged)
 
         print(f"  ✓ Consolidated {len(consolidated)} unique contracts")
         return consolidated
@@ -131,6 +441,7 @@ class COTDataManager:
             by_report_type: Save separate files for each report type
             by_contract: Save separate files for each contract
         """
+        self._check_complete()
         print("\nSaving data to parquet files...")
 
         if by_report_type:
@@ -139,78 +450,255 @@ class COTDataManager:
 
             for report_type, df in self.dataframes.items():
                 if not df.empty:
-                    # Clean the dataframe to handle mixed types
-                    df_clean = df.copy()
-
-                    # Convert object columns with mixed types to strings
-                    for col in df_clean.columns:
-                        if df_clean[col].dtype == 'object':
-                            try:
-                                # Try to convert to numeric first
-                                df_clean[col] = pd.to_numeric(df_clean[col], errors='ignore')
-                            except:
-                                pass
-
-                            # If still object type, convert to string
-                            if df_clean[col].dtype == 'object':
-                                df_clean[col] = df_clean[col].astype(str)
-
-                    filepath = report_dir / f"{report_type}.parquet"
-                    df_clean.to_parquet(filepath, index=False, engine='pyarrow')
-                    print(f"  ✓ Saved {report_type} ({len(df_clean):,} records)")
+                    # Frames are normalized when fetched, so write them directly.
+                    # Rows are clustered by contract and date so row group
+                    # min/max statistics let contract filters skip row groups.
+                    schema = self.get_schema(report_type)
+                    sort_cols = [col for col in (schema.contract_col, schema.date_col) if col]
+                    if sort_cols:
+                        df = df.sort_values(sort_cols)
+
+                    filepath = self._parquet_path(report_type)
+                    df.to_parquet(
+                        filepath,
+                        index=False,
+                        engine='pyarrow',
+                        row_group_size=50_000,
+                        **self.PARQUET_WRITE_OPTIONS
+                    )
+                    print(f"  ✓ Saved {report_type} ({len(df):,} records)")
 
         if by_contract:
             contract_dir = self.data_dir / "by_contract"
             contract_dir.mkdir(exist_ok=True)
 
+            # Remove per-contract files written by older versions so they
+            # are not picked up as part of the dataset
+            for old_file in contract_dir.glob("*.parquet"):
+                old_file.unlink()
+
             consolidated = self.consolidate_by_contract()
-            for contract, df in consolidated.items():
-                # Clean the dataframe to handle mixed types
-                df_clean = df.copy()
+            if consolidated:
+                # One hive-partitioned dataset keyed by the cleaned contract
+                # name. Contracts are converted and written one at a time
+                # against a schema covering every report format.
+                schema = _unified_schema(
+                    pa.Schema.from_pandas(df, preserve_index=False) for df in consolidated.values()
+                ).append(pa.field("safe_contract", pa.string()))
+
+                def contract_batches():
+                    for contract, df in consolidated.items():
+                        table = pa.Table.from_pandas(df, preserve_index=False).append_column(
+                            "safe_contract", pa.array([safe_contract_name(contract)] * len(df), pa.string())
+                        )
+                        yield from _conform_table(table, schema).to_batches()
+
+                ds.write_dataset(
+                    contract_batches(),
+                    contract_dir,
+                    schema=schema,
+                    format="parquet",
+                    file_options=ds.ParquetFileFormat().make_write_options(**self.PARQUET_WRITE_OPTIONS),
+                    partitioning=ds.partitioning(
+                        pa.schema([("safe_contract", pa.string())]), flavor="hive"
+                    ),
+                    max_partitions=len(consolidated),
+                    existing_data_behavior="delete_matching",
+                )
+
+            print(f"  ✓ Saved {len(consolidated)} contract partitions")
+
+    def _parquet_path(self, report_type: str) -> Path:
+        """Return the parquet file path for a report type."""
+        return self.data_dir / "by_report_type" / f"{report_type}.parquet"
 
-                # Convert object columns with mixed types to strings
-                for col in df_clean.columns:
-                    if df_clean[col].dtype == 'object':
-                        try:
-                            # Try to convert to numeric first
-                            df_clean[col] = pd.to_numeric(df_clean[col], errors='ignore')
-                        except:
-                            pass
+    @staticmethod
+    def _read_parquet(path: Path, columns: Optional[List[str]] = None, filters=None) -> pd.DataFrame:
+        """
+        Read a parquet file into a DataFrame.
 
-                        # If still object type, convert to string
-                        if df_clean[col].dtype == 'object':
-                            df_clean[col] = df_clean[col].astype(str)
+        pre_buffer coalesces adjacent column chunk reads into fewer larger
+        ones and use_threads decodes columns in parallel.
+        """
+        return pq.read_table(
+            path,
+            columns=columns,
+            filters=filters,
+            pre_buffer=True,
+            use_threads=True,
+        ).to_pandas()
+
+    def _loaded_frame(self, report_type: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Return the already loaded frame for a report type, if it can be reused.
 
-                # Clean contract name for filename
-                safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in contract)
-                safe_name = safe_name.replace(' ', '_')[:100]  # Limit filename length
+        A frame is reused when its parquet file has not been modified since
+        it was loaded and it holds every requested column.
+        """
+        if report_type not in self._loaded_mtimes:
+            return None
+        if self._loaded_mtimes[report_type] != self._parquet_path(report_type).stat().st_mtime_ns:
+            return None
 
-                filepath = contract_dir / f"{safe_name}.parquet"
-                df_clean.to_parquet(filepath, index=False, engine='pyarrow')
+        df = self.dataframes[report_type]
+        if columns is None:
+            return None if report_type in self._partial_reports else df
+        if set(columns) <= set(df.columns):
+            return df[columns]
+        return None
+
+    def _store_loaded_frame(self, report_type: str, df: pd.DataFrame, mtime_ns: int, partial: bool) -> pd.DataFrame:
+        """Store a frame read from parquet and remember the file's mtime."""
+        self._store_frame(report_type, df, partial=partial)
+        self._loaded_mtimes[report_type] = mtime_ns
+        return df
+
+    def get_parquet_schema(self, report_type: str) -> ColumnSchema:
+        """
+        Detect the column schema of a saved report type from its parquet footer.
 
-            print(f"  ✓ Saved {len(consolidated)} contract files")
+        Only the file metadata is read, so this can be used to choose the
+        columns to pass to load_from_parquet.
+
+        Args:
+            report_type: The COT report type
 
-    def load_from_parquet(self, report_type: Optional[str] = None) -> pd.DataFrame:
+        Returns:
+            ColumnSchema for the saved report type
+        """
+        return detect_column_schema(pq.read_schema(self._parquet_path(report_type)).names)
+
+    def load_from_parquet(
+        self,
+        report_type: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        force_reload: bool = False
+    ) -> pd.DataFrame:
         """
         Load data from parquet files.
 
+        Report types already loaded from an unchanged file are returned
+        without reading it again, unless force_reload is set.
+
         Args:
             report_type: Specific report type to load, or None for all
+            columns: Optional subset of columns to read (e.g.
+                get_parquet_schema(report_type).columns()). Report types
+                loaded this way are read-only: save_to_parquet and
+                consolidate_by_contract refuse them until reloaded in full.
+            force_reload: Read the files even if already loaded
 
         Returns:
             DataFrame with loaded data
         """
+        partial = columns is not None
         if report_type:
-            filepath = self.data_dir / "by_report_type" / f"{report_type}.parquet"
-            return pd.read_parquet(filepath)
+            if not force_reload:
+                df = self._loaded_frame(report_type, columns)
+                if df is not None:
+                    return df
+
+            path = self._parquet_path(report_type)
+            mtime_ns = path.stat().st_mtime_ns
+            df = self._read_parquet(path, columns=columns)
+            return self._store_loaded_frame(report_type, df, mtime_ns, partial)
         else:
-            # Load all report types
-            for report_type in self.REPORT_TYPES:
-                filepath = self.data_dir / "by_report_type" / f"{report_type}.parquet"
-                if filepath.exists():
-                    self.dataframes[report_type] = pd.read_parquet(filepath)
+            # Load all report types, reading the files concurrently
+            # (pyarrow releases the GIL during I/O and decoding)
+            report_types = [
+                rt for rt in self.REPORT_TYPES
+                if self._parquet_path(rt).exists()
+                and (force_reload or self._loaded_frame(rt, columns) is None)
+            ]
+            if not report_types:
+                return self.dataframes
+
+            mtimes = {rt: self._parquet_path(rt).stat().st_mtime_ns for rt in report_types}
+            with ThreadPoolExecutor(max_workers=len(report_types)) as executor:
+                futures = {
+                    report_type: executor.submit(
+                        self._read_parquet, self._parquet_path(report_type), columns
+                    )
+                    for report_type in report_types
+                }
+
+            for report_type, future in futures.items():
+                self._store_loaded_frame(report_type, future.result(), mtimes[report_type], partial)
             return self.dataframes
 
+    def load_contract(
+        self,
+        report_type: str,
+        contract_name: str,
+        columns: Optional[List[str]] = None,
+        engine: str = 'pyarrow'
+    ) -> pd.DataFrame:
+        """
+        Load the rows of a single contract from a saved report type.
+
+        The contract filter is pushed down to the parquet reader, so row
+        groups that cannot contain the contract are skipped.
+
+        Args:
+            report_type: The COT report type
+            contract_name: Name of the contract
+            columns: Optional subset of columns to read
+            engine: 'pyarrow' (default) or 'polars'. The polars engine scans
+                the file lazily and collects only the filtered rows; it falls
+                back to pyarrow when polars is not installed.
+
+        Returns:
+            DataFrame with the contract's rows (date column as datetime64)
+        """
+        schema = self.get_parquet_schema(report_type)
+        contract_col = schema.contract_col
+        if contract_col is None:
+            raise ValueError(f"Could not find contract column in {report_type}")
+
+        path = self._parquet_path(report_type)
+        if engine == 'polars' and pl is None:
+            print("⚠ polars is not installed, falling back to pyarrow")
+            engine = 'pyarrow'
+
+        if engine == 'polars':
+            lazy = pl.scan_parquet(path).filter(pl.col(contract_col) == contract_name)
+            if columns is not None:
+                lazy = lazy.select(columns)
+            df = lazy.collect().to_pandas()
+        elif engine == 'pyarrow':
+            df = self._read_parquet(
+                path,
+                columns=columns,
+                filters=[(contract_col, '=', contract_name)],
+            )
+        else:
+            raise ValueError(f"Unknown engine: {engine}. Must be 'pyarrow' or 'polars'")
+        # Dates are normally stored as datetime64 already
+        if schema.date_col:
+            self._ensure_datetime(df, schema.date_col)
+        return df
+
+    def load_consolidated_contract(self, contract_name: str) -> pd.DataFrame:
+        """
+        Load the consolidated history of one contract from the by_contract dataset.
+
+        Only the contract's partition is read.
+
+        Args:
+            contract_name: Name of the contract
+
+        Returns:
+            DataFrame with the contract's consolidated data
+        """
+        contract_dir = self.data_dir / "by_contract"
+        # Hive partitioning is discovered from the directory names
+        df = self._read_parquet(
+            contract_dir,
+            filters=[("safe_contract", "=", safe_contract_name(contract_name))],
+        ).drop(columns=["safe_contract"])
+        # Drop columns that only exist for other report formats
+        return df.dropna(axis=1, how="all")
+
     def get_available_contracts(self, report_type: str) -> List[str]:
         """
         Get list of available contracts for a given report type.
@@ -224,14 +712,22 @@ class COTDataManager:
         if report_type not in self.dataframes or self.dataframes[report_type].empty:
             return []
 
-        df = self.dataframes[report_type]
+        if report_type in self._contracts_cache:
+            return self._contracts_cache[report_type]
 
-        # Find contract column
-        for col in df.columns:
-            if 'market' in col.lower() or 'contract' in col.lower():
-                return sorted(df[col].unique().tolist())
+        contract_col = self.get_schema(report_type).contract_col
+        if contract_col is None:
+            return []
 
-        return []
+        names = self.dataframes[report_type][contract_col]
+        if isinstance(names.dtype, pd.CategoricalDtype):
+            # Stored frames keep the contract column categorical, so the
+            # distinct names are already known without a pass over the rows
+            contracts = sorted(names.cat.categories.tolist())
+        else:
+            contracts = sorted(names.unique().tolist())
+        self._contracts_cache[report_type] = contracts
+        return contracts
 
 
 class COTPlotter:
@@ -244,7 +740,8 @@ class COTPlotter:
         report_type: str = 'legacy_fut',
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        figsize: Tuple[int, int] = (16, 10)
+        figsize: Tuple[int, int] = (16, 10),
+        schema: Optional[ColumnSchema] = None
     ):
         """
         Plot trader positions as time series bar chart with black background.
@@ -263,24 +760,18 @@ class COTPlotter:
             start_date: Optional start date for filtering (defaults to 5 years ago)
             end_date: Optional end date for filtering (defaults to now)
             figsize: Figure size tuple
+            schema: Optional precomputed column schema (e.g. from
+                COTDataManager.get_schema); detected from df if omitted
         """
-        # Find date column
-        date_col = None
-        for col in df.columns:
-            if 'date' in col.lower() and 'yyyy' in col.lower():
-                date_col = col
-                break
+        if schema is None:
+            schema = detect_column_schema(df.columns)
 
+        date_col = schema.date_col
         if date_col is None:
             raise ValueError("Could not find date column in dataframe")
 
         # Filter by contract
-        contract_col = None
-        for col in df.columns:
-            if 'market' in col.lower() or 'contract' in col.lower():
-                contract_col = col
-                break
-
+        contract_col = schema.contract_col
         if contract_col is None:
             raise ValueError("Could not find contract column in dataframe")
 
@@ -290,8 +781,9 @@ class COTPlotter:
             print(f"No data found for contract: {contract_name}")
             return
 
-        # Ensure date column is datetime
-        plot_df[date_col] = pd.to_datetime(plot_df[date_col])
+        # Ensure date column is datetime (already parsed for managed frames)
+        if not pd.api.types.is_datetime64_any_dtype(plot_df[date_col]):
+            plot_df[date_col] = pd.to_datetime(plot_df[date_col])
 
         # Filter by date range if specified
         # Default to last 5 years if no dates specified
@@ -310,100 +802,48 @@ class COTPlotter:
 
         # For legacy reports, calculate net positions (Long - Short)
         if 'legacy' in report_type.lower():
-            # Try different column name formats
-            # Format 1: "Commercial Positions-Long (All)"
-            # Format 2: "Comm_Positions_Long_All"
-
-            # Find the correct column names - prefer "Positions" over "Traders"
-            comm_long = None
-            comm_short = None
-            noncomm_long = None
-            noncomm_short = None
-            small_long = None
-            small_short = None
-
-            # First pass: look for "Positions" columns (preferred)
-            for col in plot_df.columns:
-                col_lower = col.lower()
-                if 'positions' in col_lower:
-                    # Commercial
-                    if 'commercial' in col_lower and 'noncommercial' not in col_lower:
-                        if 'long' in col_lower and '(all)' in col_lower:
-                            comm_long = col
-                        elif 'short' in col_lower and '(all)' in col_lower:
-                            comm_short = col
-                    # Noncommercial (Large Speculators)
-                    elif 'noncommercial' in col_lower and 'spreading' not in col_lower:
-                        if 'long' in col_lower and '(all)' in col_lower:
-                            noncomm_long = col
-                        elif 'short' in col_lower and '(all)' in col_lower:
-                            noncomm_short = col
-                    # Nonreportable (Small Speculators)
-                    elif 'nonreportable' in col_lower:
-                        if 'long' in col_lower and '(all)' in col_lower:
-                            small_long = col
-                        elif 'short' in col_lower and '(all)' in col_lower:
-                            small_short = col
-
-            # Second pass: fallback to "Traders" columns if not found
-            if not noncomm_long or not noncomm_short:
-                for col in plot_df.columns:
-                    col_lower = col.lower()
-                    if 'trader' in col_lower:
-                        # Commercial
-                        if 'commercial' in col_lower and 'noncommercial' not in col_lower:
-                            if 'long' in col_lower and '(all)' in col_lower and not comm_long:
-                                comm_long = col
-                            elif 'short' in col_lower and '(all)' in col_lower and not comm_short:
-                                comm_short = col
-                        # Noncommercial (Large Speculators)
-                        elif 'noncommercial' in col_lower and 'spreading' not in col_lower:
-                            if 'long' in col_lower and '(all)' in col_lower and not noncomm_long:
-                                noncomm_long = col
-                            elif 'short' in col_lower and '(all)' in col_lower and not noncomm_short:
-                                noncomm_short = col
-                        # Nonreportable (Small Speculators)
-                        elif 'nonreportable' in col_lower:
-                            if 'long' in col_lower and '(all)' in col_lower and not small_long:
-                                small_long = col
-                            elif 'short' in col_lower and '(all)' in col_lower and not small_short:
-                                small_short = col
+            # Position columns - "Positions" preferred over "Traders"
+            comm_long, comm_short = schema.comm_long, schema.comm_short
+            noncomm_long, noncomm_short = schema.noncomm_long, schema.noncomm_short
+            small_long, small_short = schema.small_long, schema.small_short
 
             # Calculate net positions (Long - Short)
             # Positive = Net Long, Negative = Net Short
-            trader_data = []
-
-            if comm_long and comm_short:
-                plot_df[comm_long] = pd.to_numeric(plot_df[comm_long], errors='coerce').fillna(0)
-                plot_df[comm_short] = pd.to_numeric(plot_df[comm_short], errors='coerce').fillna(0)
-                plot_df['Commercial_Net'] = plot_df[comm_long] - plot_df[comm_short]
-                trader_data.append(('Large Commercials', 'Commercial_Net', 'red'))
-
-            if noncomm_long and noncomm_short:
-                plot_df[noncomm_long] = pd.to_numeric(plot_df[noncomm_long], errors='coerce').fillna(0)
-                plot_df[noncomm_short] = pd.to_numeric(plot_df[noncomm_short], errors='coerce').fillna(0)
-                plot_df['NonCommercial_Net'] = plot_df[noncomm_long] - plot_df[noncomm_short]
-                trader_data.append(('Large Speculators', 'NonCommercial_Net', 'blue'))
-
-            if small_long and small_short:
-                plot_df[small_long] = pd.to_numeric(plot_df[small_long], errors='coerce').fillna(0)
-                plot_df[small_short] = pd.to_numeric(plot_df[small_short], errors='coerce').fillna(0)
-                plot_df['NonReportable_Net'] = plot_df[small_long] - plot_df[small_short]
-                trader_data.append(('Small Speculators', 'NonReportable_Net', 'yellow'))
-
-            if not trader_data:
+            trader_pairs = [
+                ('Large Commercials', comm_long, comm_short, 'red'),
+                ('Large Speculators', noncomm_long, noncomm_short, 'blue'),
+                ('Small Speculators', small_long, small_short, 'yellow'),
+            ]
+            trader_pairs = [pair for pair in trader_pairs if pair[1] and pair[2]]
+
+            if not trader_pairs:
                 print(f"Could not find position columns for {report_type}")
                 print(f"Available columns: {list(plot_df.columns)}")
                 return
 
-            # Create the plot with black background
-            plt.style.use('dark_background')
+            # One (rows x 2*traders) float array with long/short columns
+            # interleaved, so all nets come from a single subtraction
+            position_cols = [col for _, long_col, short_col, _ in trader_pairs for col in (long_col, short_col)]
+            positions_df = plot_df[position_cols]
+            if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in positions_df.dtypes):
+                positions_df = positions_df.apply(pd.to_numeric, errors='coerce')
+            positions = positions_df.to_numpy(dtype=np.float64, na_value=0.0)
+            nets = positions[:, 0::2] - positions[:, 1::2]
+
+            trader_data = [
+                (label, nets[:, i], color)
+                for i, (label, _, _, color) in enumerate(trader_pairs)
+            ]
+
+            # Create the plot with black background (styled per artist
+            # rather than swapping the global style)
             fig, ax = plt.subplots(figsize=figsize, facecolor='black')
             ax.set_facecolor('black')
+            for spine in ax.spines.values():
+                spine.set_edgecolor('white')
 
             # Create time series
-            dates = plot_df[date_col].values
-            x_pos = range(len(dates))
+            x_pos = np.arange(len(plot_df))
             n_traders = len(trader_data)
 
             # Calculate bar width and positions for grouped bars
@@ -420,10 +860,8 @@ class COTPlotter:
                 offsets = [0]
 
             # Plot each trader type as bars
-            for i, (label, col, color) in enumerate(trader_data):
-                values = plot_df[col].values
-                positions = [x + offsets[i] for x in x_pos]
-                ax.bar(positions, values, width=bar_width, label=label, color=color, alpha=0.8)
+            for i, (label, values, color) in enumerate(trader_data):
+                ax.bar(x_pos + offsets[i], values, width=bar_width, label=label, color=color, alpha=0.8)
 
             # Formatting
             ax.set_xlabel('Date', fontsize=14, color='white')
@@ -447,9 +885,9 @@ class COTPlotter:
             n_ticks = min(15, len(plot_df))
             if n_ticks > 0:
                 tick_indices = [int(i * len(plot_df) / n_ticks) for i in range(n_ticks)]
-                ax.set_xticks([x_pos[i] for i in tick_indices])
-                ax.set_xticklabels([plot_df.iloc[i][date_col].strftime('%Y-%m-%d') for i in tick_indices],
-                                  rotation=45, ha='right', color='white')
+                tick_labels = plot_df[date_col].iloc[tick_indices].dt.strftime('%Y-%m-%d').tolist()
+                ax.set_xticks(x_pos[tick_indices])
+                ax.set_xticklabels(tick_labels, rotation=45, ha='right', color='white')
 
             # White tick labels
             ax.tick_params(colors='white')
@@ -460,9 +898,6 @@ class COTPlotter:
             plt.tight_layout()
             plt.show()
 
-            # Reset style
-            plt.style.use('default')
-
         else:
             print(f"Report type {report_type} not yet supported. Use 'legacy_fut'.")
 
@@ -2,177 +2,145 @@
 Validate COT data by showing raw values for a specific contract and date.
 """
 
+from itertools import repeat
 from main import COTDataManager
+import numpy as np
 import pandas as pd
 
 
-def validate_cot_data(contract_search, date_search=None):
+# Map common aliases (keys are uppercase)
+ALIASES = {
+    'CAD': 'CANADIAN DOLLAR',
+    'EUR': 'EURO FX',
+    'GBP': 'BRITISH POUND',
+    'JPY': 'JAPANESE YEN',
+    'GOLD': 'GOLD',
+    'SILVER': 'SILVER',
+    'CRUDE': 'CRUDE OIL',
+}
+
+
+def validate_cot_data(contract_search, date_search=None, engine='pyarrow'):
     """
     Show raw COT data for validation.
 
     Args:
         contract_search: Contract name or search term
         date_search: Optional date to filter (YYYY-MM-DD format)
+        engine: Parquet reader for the contract's rows ('pyarrow' or 'polars')
     """
     manager = COTDataManager(data_dir='data')
 
     print("Loading data...")
-    manager.load_from_parquet()
-
-    df = manager.dataframes['legacy_fut']
-
-    # Find contract column
-    contract_col = None
-    for col in df.columns:
-        if 'market' in col.lower() or 'contract' in col.lower():
-            contract_col = col
-            break
-
-    # Find date column
-    date_col = None
-    for col in df.columns:
-        if 'date' in col.lower() and 'yyyy' in col.lower():
-            date_col = col
-            break
-
-    # Map common aliases
-    aliases = {
-        'CAD': 'CANADIAN DOLLAR',
-        'EUR': 'EURO FX',
-        'GBP': 'BRITISH POUND',
-        'JPY': 'JAPANESE YEN',
-        'GOLD': 'GOLD',
-        'SILVER': 'SILVER',
-        'CRUDE': 'CRUDE OIL',
-    }
+    # Column names are detected from the parquet footer. Only the contract
+    # names are loaded up front; the chosen contract's rows are read later
+    # with the filter pushed down to the parquet reader.
+    schema = manager.get_parquet_schema('legacy_fut')
+    contract_col = schema.contract_col
+    date_col = schema.date_col
+    df = manager.load_from_parquet('legacy_fut', columns=[contract_col])
 
     search_term = contract_search.upper()
-    if search_term in aliases:
-        search_term = aliases[search_term]
+    search_term = ALIASES.get(search_term, search_term)
 
-    # Search for contract
-    contracts = df[contract_col].unique()
-    matches = [c for c in contracts if search_term in c.upper()]
+    # Search for contract. The manager stores the contract column as a
+    # categorical, so only the distinct names (its categories) are searched.
+    contracts = df[contract_col].cat.categories
+    matches = list(contracts[contracts.str.contains(search_term, case=False, regex=False, na=False)])
 
     if not matches:
         print(f"No contracts found matching '{contract_search}'")
         return
 
-    print(f"\nFound {len(matches)} matching contract(s):")
-    for i, c in enumerate(matches, 1):
-        print(f"  {i}. {c}")
+    # A single match is only shown on the "Using" line below
+    if len(matches) > 1:
+        print(f"\nFound {len(matches)} matching contract(s):")
+        for i, c in enumerate(matches, 1):
+            print(f"  {i}. {c}")
 
     contract = matches[0]
     print(f"\nUsing: {contract}")
 
-    # Filter data
-    data = df[df[contract_col] == contract].copy()
-    data[date_col] = pd.to_datetime(data[date_col])
-    data = data.sort_values(date_col, ascending=False)
+    # Load only this contract's rows, and only the columns shown below
+    data = manager.load_contract('legacy_fut', contract, columns=schema.columns(), engine=engine)
+
+    # Position columns - "Positions" preferred over "Traders"
+    comm_long, comm_short = schema.comm_long, schema.comm_short
+    noncomm_long, noncomm_short = schema.noncomm_long, schema.noncomm_short
+    small_long, small_short = schema.small_long, schema.small_short
+
+    # Position columns are stored as numbers by fetch_all_data, so they
+    # need no conversion here
 
     if date_search:
         # Filter by date
         date_search = pd.to_datetime(date_search)
-        # Find closest date
-        data['date_diff'] = abs(data[date_col] - date_search)
-        closest_idx = data['date_diff'].idxmin()
-        data = data.loc[[closest_idx]]
-
-    # Find position columns - prefer "Positions" over "Traders"
-    comm_long = None
-    comm_short = None
-    noncomm_long = None
-    noncomm_short = None
-    small_long = None
-    small_short = None
-
-    # First pass: look for "Positions" columns (preferred)
-    for col in data.columns:
-        col_lower = col.lower()
-        if 'positions' in col_lower:
-            if 'commercial' in col_lower and 'noncommercial' not in col_lower:
-                if 'long' in col_lower and '(all)' in col_lower:
-                    comm_long = col
-                elif 'short' in col_lower and '(all)' in col_lower:
-                    comm_short = col
-            elif 'noncommercial' in col_lower and 'spreading' not in col_lower:
-                if 'long' in col_lower and '(all)' in col_lower:
-                    noncomm_long = col
-                elif 'short' in col_lower and '(all)' in col_lower:
-                    noncomm_short = col
-            elif 'nonreportable' in col_lower:
-                if 'long' in col_lower and '(all)' in col_lower:
-                    small_long = col
-                elif 'short' in col_lower and '(all)' in col_lower:
-                    small_short = col
-
-    # Second pass: fallback to "Traders" columns if not found
-    if not noncomm_long or not noncomm_short:
-        for col in data.columns:
-            col_lower = col.lower()
-            if 'trader' in col_lower:
-                if 'commercial' in col_lower and 'noncommercial' not in col_lower:
-                    if 'long' in col_lower and '(all)' in col_lower and not comm_long:
-                        comm_long = col
-                    elif 'short' in col_lower and '(all)' in col_lower and not comm_short:
-                        comm_short = col
-                elif 'noncommercial' in col_lower and 'spreading' not in col_lower:
-                    if 'long' in col_lower and '(all)' in col_lower and not noncomm_long:
-                        noncomm_long = col
-                    elif 'short' in col_lower and '(all)' in col_lower and not noncomm_short:
-                        noncomm_short = col
-                elif 'nonreportable' in col_lower:
-                    if 'long' in col_lower and '(all)' in col_lower and not small_long:
-                        small_long = col
-                    elif 'short' in col_lower and '(all)' in col_lower and not small_short:
-                        small_short = col
+        # Find closest date (ties go to the later date). Saved reports are
+        # sorted by date within each contract, so this rarely has to sort.
+        dates = pd.DatetimeIndex(data[date_col])
+        if not dates.is_monotonic_increasing:
+            data = data.sort_values(date_col, kind='stable')
+            dates = pd.DatetimeIndex(data[date_col])
+        if dates.is_unique:
+            closest = dates.get_indexer([date_search], method='nearest')[0]
+        else:
+            # get_indexer needs unique dates; the same report date can
+            # appear more than once under one contract name. Take the last
+            # minimum so ties still go to the later date.
+            diff = abs(dates - date_search)
+            closest = np.flatnonzero(diff == diff.min())[-1]
+        data = data.iloc[[closest]]
+    else:
+        # Ten most recent, newest first, without sorting the full history
+        data = data.nlargest(10, date_col)
 
     # Show the data
     print("\n" + "=" * 80)
     print("RAW COT DATA")
     print("=" * 80)
 
-    # Convert position columns to numeric before iteration
-    if comm_long:
-        data[comm_long] = pd.to_numeric(data[comm_long], errors='coerce')
-    if comm_short:
-        data[comm_short] = pd.to_numeric(data[comm_short], errors='coerce')
-    if noncomm_long:
-        data[noncomm_long] = pd.to_numeric(data[noncomm_long], errors='coerce')
-    if noncomm_short:
-        data[noncomm_short] = pd.to_numeric(data[noncomm_short], errors='coerce')
-    if small_long:
-        data[small_long] = pd.to_numeric(data[small_long], errors='coerce')
-    if small_short:
-        data[small_short] = pd.to_numeric(data[small_short], errors='coerce')
-
-    for idx, row in data.head(10).iterrows():
-        print(f"\nDate: {row[date_col].strftime('%Y-%m-%d')}")
+    # Compute nets and format all displayed values up front; the loop only prints
+    head = data.head(10)
+    dates = head[date_col].dt.strftime('%Y-%m-%d').to_numpy()
+
+    def pair_values(long_col, short_col):
+        # Formatted (long, short, net) strings, or endless Nones when a column is missing
+        if long_col and short_col:
+            longs = head[long_col].to_numpy()
+            shorts = head[short_col].to_numpy()
+            # np.char has no thousands separator, so format each value once here
+            return tuple(
+                [format(x, '>15,.0f') for x in values]
+                for values in (longs, shorts, longs - shorts)
+            )
+        return repeat(None), repeat(None), repeat(None)
+
+    cl_str, cs_str, net_c = pair_values(comm_long, comm_short)
+    nl_str, ns_str, net_n = pair_values(noncomm_long, noncomm_short)
+    sl_str, ss_str, net_s = pair_values(small_long, small_short)
+
+    rows = zip(dates, cl_str, cs_str, net_c, nl_str, ns_str, net_n, sl_str, ss_str, net_s)
+    for date, cl, cs, nc, nl, ns, nn, sl, ss, sn in rows:
+        print(f"\nDate: {date}")
         print("-" * 80)
 
         if comm_long and comm_short:
-            cl = row[comm_long]
-            cs = row[comm_short]
             print(f"\nLARGE COMMERCIALS:")
-            print(f"  Long:  {cl:>15,.0f}")
-            print(f"  Short: {cs:>15,.0f}")
-            print(f"  Net:   {cl - cs:>15,.0f}  (Long - Short)")
+            print(f"  Long:  {cl}")
+            print(f"  Short: {cs}")
+            print(f"  Net:   {nc}  (Long - Short)")
 
         if noncomm_long and noncomm_short:
-            nl = row[noncomm_long]
-            ns = row[noncomm_short]
             print(f"\nLARGE SPECULATORS (Non-Commercial):")
-            print(f"  Long:  {nl:>15,.0f}")
-            print(f"  Short: {ns:>15,.0f}")
-            print(f"  Net:   {nl - ns:>15,.0f}  (Long - Short)")
+            print(f"  Long:  {nl}")
+            print(f"  Short: {ns}")
+            print(f"  Net:   {nn}  (Long - Short)")
 
         if small_long and small_short:
-            sl = row[small_long]
-            ss = row[small_short]
             print(f"\nSMALL SPECULATORS (Non-Reportable):")
-            print(f"  Long:  {sl:>15,.0f}")
-            print(f"  Short: {ss:>15,.0f}")
-            print(f"  Net:   {sl - ss:>15,.0f}  (Long - Short)")
+            print(f"  Long:  {sl}")
+            print(f"  Short: {ss}")
+            print(f"  Net:   {sn}  (Long - Short)")
 
         print("\n" + "=" * 80)
 
@@ -180,13 +148,16 @@ def validate_cot_data(contract_search, date_search=None):
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) < 2:
-        print("Usage: python validate_data.py <contract> [date]")
+    args = [arg for arg in sys.argv[1:] if arg != '--polars']
+    engine = 'polars' if '--polars' in sys.argv[1:] else 'pyarrow'
+
+    if len(args) < 1:
+        print("Usage: python validate_data.py <contract> [date] [--polars]")
         print("Example: python validate_data.py CAD 2024-10-08")
-        print("Example: python validate_data.py GOLD")
+        print("Example: python validate_data.py GOLD --polars")
         sys.exit(1)
 
-    contract = sys.argv[1]
-    date = sys.argv[2] if len(sys.argv) > 2 else None
+    contract = args[0]
+    date = args[1] if len(args) > 1 else None
 
-    validate_cot_data(contract, date)
+    validate_cot_data(contract, date, engine=engine)